@@ -33,7 +33,6 @@
 
 from __future__ import unicode_literals
 
-import win32com.client  # @UnresolvedImport, pylint: disable=import-error
 import win32com.server.policy  # @UnresolvedImport, pylint: disable=import-error
 import os
 
@@ -30,12 +30,16 @@
 """
 @author: Adolfo Gómez, dkmaster at dkmon dot com
 """
+import functools
+import inspect
 import logging
 import typing
 
+from django.db.models import Count
 from django.utils.translation import gettext, gettext_lazy as _
-from uds.models import Authenticator, Network
+from uds.models import Authenticator, Network, UserService
 from uds.core import auths
+from uds.core.environment import Environment
 
 from uds.REST import NotFound
 from uds.REST.model import ModelHandler
@@ -51,6 +55,33 @@ if typing.TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _typeInfo(type_: typing.Type['Module']) -> typing.Dict[str, typing.Any]:
+    # Info only depends on class, labels are lazy so they are translated on every response
+    if issubclass(type_, auths.Authenticator):
+        return {
+            'canSearchUsers': type_.searchUsers != auths.Authenticator.searchUsers,  # type: ignore
+            'canSearchGroups': type_.searchGroups != auths.Authenticator.searchGroups,  # type: ignore
+            'needsPassword': type_.needsPassword,
+            'userNameLabel': _(type_.userNameLabel),
+            'groupNameLabel': _(type_.groupNameLabel),
+            'passwordLabel': _(type_.passwordLabel),
+            'canCreateUsers': type_.createUser != auths.Authenticator.createUser,  # type: ignore
+            'isExternal': type_.isExternalSource,
+        }
+    # Not of my type
+    return {}
+
+
+@functools.lru_cache(maxsize=128)
+def _acceptsLimit(method: typing.Callable) -> bool:
+    # Search methods of authenticators not updated to receive "limit" are still supported
+    params = inspect.signature(method).parameters
+    return 'limit' in params or any(
+        p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
 # Enclosed methods under /auth path
 class Authenticators(ModelHandler):
     model = Authenticator
@@ -93,19 +124,8 @@ class Authenticators(ModelHandler):
         return auths.factory().providers().values()
 
     def typeInfo(self, type_: typing.Type['Module']) -> typing.Dict[str, typing.Any]:
-        if issubclass(type_, auths.Authenticator):
-            return {
-                'canSearchUsers': type_.searchUsers != auths.Authenticator.searchUsers,  # type: ignore
-                'canSearchGroups': type_.searchGroups != auths.Authenticator.searchGroups,  # type: ignore
-                'needsPassword': type_.needsPassword,
-                'userNameLabel': _(type_.userNameLabel),
-                'groupNameLabel': _(type_.groupNameLabel),
-                'passwordLabel': _(type_.passwordLabel),
-                'canCreateUsers': type_.createUser != auths.Authenticator.createUser,  # type: ignore
-                'isExternal': type_.isExternalSource,
-            }
-        # Not of my type
-        return {}
+        # Copy so callers (typeAsDict) can update it without altering the cached one
+        return dict(_typeInfo(type_))
 
     def getGui(self, type_: str) -> typing.List[typing.Any]:
         try:
@@ -139,8 +159,32 @@ class Authenticators(ModelHandler):
         except Exception:
             raise NotFound('type not found')
 
+    # Effective permissions of current user over listed items, filled on getItems
+    _perm_cache: typing.Dict[int, int]
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._perm_cache = {}
+
+    def getItems(self, *args, **kwargs):
+        # Optimized query, tags & networks are prefetched and users are counted on a single query
+        items = list(
+            Authenticator.objects.prefetch_related('tags', 'networks').annotate(
+                users_count=Count('users')
+            )
+        )
+        # Permissions for all items are also retrieved at once
+        self._perm_cache = permissions.getEffectivePermissions(self._user, items)
+        return super().getItems(
+            overview=kwargs.get('overview', True), query=items, perms=self._perm_cache
+        )
+
     def item_as_dict(self, item: Authenticator) -> typing.Dict[str, typing.Any]:
         type_ = item.getType()
+        if hasattr(item, 'users_count'):
+            users_count = item.users_count  # type: ignore
+        else:
+            users_count = item.users.count()
         return {
             'numeric_id': item.id,
             'id': item.uuid,
@@ -152,11 +196,13 @@ class Authenticators(ModelHandler):
             'networks': [{'id': n.uuid} for n in item.networks.all()],
             'state': item.state,
             'small_name': item.small_name,
-            'users_count': item.users.count(),
+            'users_count': users_count,
             'type': type_.type(),
             'type_name': type_.name(),
             'type_info': self.typeInfo(type_),
-            'permission': permissions.getEffectivePermission(self._user, item),
+            'permission': self._perm_cache[item.id]
+            if item.id in self._perm_cache
+            else permissions.getEffectivePermission(self._user, item),
         }
 
     def afterSave(self, item: Authenticator) -> None:
@@ -186,26 +232,28 @@ class Authenticators(ModelHandler):
 
             auth = item.getInstance()
 
+            # Search capabilities are computed (and cached) per authenticator class
+            typeInfo = _typeInfo(auth.__class__)
             canDoSearch = (
-                type_ == 'user'
-                and (auth.searchUsers != auths.Authenticator.searchUsers)  # type: ignore
-                or (auth.searchGroups != auths.Authenticator.searchGroups)  # type: ignore
+                typeInfo['canSearchUsers']
+                if type_ == 'user'
+                else typeInfo['canSearchGroups']
             )
             if canDoSearch is False:
                 raise self.notSupported()
 
-            if type_ == 'user':
-                return list(auth.searchUsers(term))[:limit]
-            else:
-                return list(auth.searchGroups(term))[:limit]
+            # Limit is passed to backend if supported, result is also trimmed anyway
+            authType = type(auth)
+            search = authType.searchUsers if type_ == 'user' else authType.searchGroups
+            if _acceptsLimit(search):
+                return list(search(auth, term, limit=limit))[:limit]
+            return list(search(auth, term))[:limit]
         except Exception as e:
             logger.exception('Too many results: %s', e)
             return [{'id': _('Too many results...'), 'name': _('Refine your query')}]
             # self.invalidResponseException('{}'.format(e))
 
     def test(self, type_: str):
-        from uds.core.environment import Environment
-
         authType = auths.factory().lookup(type_)
         if not authType:
             raise self.invalidRequestException('Invalid type: {}'.format(type_))
@@ -220,10 +268,14 @@ class Authenticators(ModelHandler):
 
     def deleteItem(self, item: Authenticator):
         # For every user, remove assigned services (mark them for removal)
+        # All of them are retrieved at once and unassigned with a single update
+        userServices = list(UserService.objects.filter(user__manager=item))
+        UserService.objects.filter(id__in=[us.id for us in userServices]).update(
+            user=None
+        )
 
-        for user in item.users.all():
-            for userService in user.userServices.all():
-                userService.user = None  # type: ignore
-                userService.removeOrCancel()
+        for userService in userServices:
+            userService.user = None  # type: ignore
+            userService.removeOrCancel()
 
         item.delete()
@@ -56,6 +56,14 @@ class Connection(Handler):
     needs_admin = False
     needs_staff = False
 
+    # Default connection info, updated with transport provided data
+    CONNECTION_INFO_BASE: typing.ClassVar[typing.Mapping[str, str]] = {
+        'username': '',
+        'password': '',
+        'domain': '',
+        'protocol': 'unknown',
+    }
+
     @staticmethod
     def result(
         result: typing.Any = None,
@@ -112,13 +120,7 @@ class Connection(Handler):
                 idTransport,
                 not doNotCheck,
             )
-            ci = {
-                'username': '',
-                'password': '',
-                'domain': '',
-                'protocol': 'unknown',
-                'ip': ip,
-            }
+            ci = {**Connection.CONNECTION_INFO_BASE, 'ip': ip}
             if itrans:  # only will be available id doNotCheck is False
                 ci.update(itrans.getConnectionInfo(userService, self._user, 'UNKNOWN'))
             return Connection.result(result=ci)
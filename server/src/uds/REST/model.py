@@ -31,6 +31,7 @@
 """
 # pylint: disable=too-many-public-methods
 
+import functools
 import fnmatch
 import re
 import types
@@ -38,7 +39,7 @@ import typing
 
 import logging
 
-from django.utils.translation import gettext as _
+from django.utils.translation import gettext as _, get_language
 from django.db import IntegrityError, models
 
 from uds.core.ui import gui as uiGui
@@ -48,6 +49,7 @@ from uds.core.util.model import processUuid
 
 from uds.models import Tag, TaggingMixin, ManagedObjectModel, Network
 
+from .processors import ContentProcessor
 from .handlers import (
     Handler,
     HandlerError,
@@ -677,6 +679,20 @@ class DetailHandler(BaseModelHandler):
         raise self.invalidMethodException()
 
 
+@functools.lru_cache(maxsize=256)
+def _resolvedTableInfo(
+    handlerCls: typing.Type['ModelHandler'], language: typing.Optional[str]
+) -> typing.Tuple[str, typing.List[typing.Any]]:
+    """
+    Returns table title and fields of a model handler with lazy translations already resolved.
+    As they are class constants, they only need to get resolved once for every language.
+    """
+    return (
+        ContentProcessor.procesForRender(handlerCls.table_title),
+        ContentProcessor.procesForRender(handlerCls.table_fields),
+    )
+
+
 class ModelHandler(BaseModelHandler):
     """
     Basic Handler for a model
@@ -897,6 +913,14 @@ class ModelHandler(BaseModelHandler):
     def getItems(
         self, *args, **kwargs
     ) -> typing.Generator[typing.MutableMapping[str, typing.Any], None, None]:
+        """
+        Yields the items (as dicts) the user has read access to.
+        args and kwargs are passed as filters to model query, except for this keys:
+            overview: If True (default), items are returned using item_as_dict_overview
+            prefetch: List of related fields to prefetch
+            query: Iterable of items to use instead of querying the model
+            perms: Dict of effective permissions of user (keyed by item pk), so permissions are not queried for every item
+        """
         if 'overview' in kwargs:
             overview = kwargs['overview']
             del kwargs['overview']
@@ -910,6 +934,12 @@ class ModelHandler(BaseModelHandler):
         else:
             prefetch = []
 
+        if 'perms' in kwargs:
+            perms = kwargs['perms']
+            del kwargs['perms']
+        else:
+            perms = None
+
         if 'query' in kwargs:
             query = kwargs['query']
             logger.debug('Got query: %s', query)
@@ -922,7 +952,13 @@ class ModelHandler(BaseModelHandler):
 
         for item in query:
             try:
-                if (
+                if perms is not None:
+                    if (
+                        perms.get(item.pk, permissions.PERMISSION_NONE)
+                        < permissions.PERMISSION_READ
+                    ):
+                        continue
+                elif (
                     permissions.checkPermissions(
                         typing.cast('User', self._user),
                         item,
@@ -992,9 +1028,10 @@ class ModelHandler(BaseModelHandler):
             if self._args[0] == TYPES:
                 return list(self.getTypes())
             if self._args[0] == TABLEINFO:
+                title, fields = _resolvedTableInfo(self.__class__, get_language())
                 return self.processTableFields(
-                    self.table_title,
-                    self.table_fields,
+                    title,
+                    fields,
                     self.table_row_style,
                     self.table_subtitle,
                 )
@@ -573,7 +573,9 @@ class RegexLdap(auths.Authenticator):
         groups = self.__getGroups(user)
         groupsManager.validate(groups)
 
-    def searchUsers(self, pattern: str) -> typing.Iterable[typing.Dict[str, str]]:
+    def searchUsers(
+        self, pattern: str, limit: typing.Optional[int] = None
+    ) -> typing.Iterable[typing.Dict[str, str]]:
         try:
             res = []
             for r in ldaputil.getAsDict(
@@ -583,7 +585,8 @@ class RegexLdap(auths.Authenticator):
                     self._userClass, self._userIdAttr, ldaputil.escape(pattern)
                 ),
                 attrList=None,  # All attrs
-                sizeLimit=LDAP_RESULT_LIMIT,
+                sizeLimit=min(limit or LDAP_RESULT_LIMIT, LDAP_RESULT_LIMIT),
+                partialResults=True,
             ):
                 logger.debug('Result: %s', r)
                 res.append(
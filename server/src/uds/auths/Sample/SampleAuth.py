@@ -134,7 +134,9 @@ class SampleAuth(auths.Authenticator):
                 _('We need more than two groups!')
             )
 
-    def searchUsers(self, pattern: str) -> typing.Iterable[typing.Dict[str, str]]:
+    def searchUsers(
+        self, pattern: str, limit: typing.Optional[int] = None
+    ) -> typing.Iterable[typing.Dict[str, str]]:
         """
         Here we will receive a pattern for searching users.
 
@@ -149,10 +151,12 @@ class SampleAuth(auths.Authenticator):
                 'id': '{0}-{1}'.format(pattern, a),
                 'name': '{0} number {1}'.format(pattern, a),
             }
-            for a in range(1, 10)
+            for a in range(1, min(limit or 9, 9) + 1)
         ]
 
-    def searchGroups(self, pattern: str) -> typing.Iterable[typing.Dict[str, str]]:
+    def searchGroups(
+        self, pattern: str, limit: typing.Optional[int] = None
+    ) -> typing.Iterable[typing.Dict[str, str]]:
         """
         Here we we will receive a patter for searching groups.
 
@@ -165,6 +169,8 @@ class SampleAuth(auths.Authenticator):
         for g in self.groups.value:
             if g.lower().find(pattern) != -1:
                 res.append({'id': g, 'name': ''})
+                if limit and len(res) >= limit:
+                    break
         return res
 
     def authenticate(
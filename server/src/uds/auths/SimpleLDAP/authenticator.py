@@ -477,7 +477,9 @@ class SimpleLDAPAuthenticator(auths.Authenticator):
             raise auths.exceptions.AuthenticatorException(_('Username not found'))
         groupsManager.validate(self.__getGroups(user))
 
-    def searchUsers(self, pattern: str) -> typing.Iterable[typing.Dict[str, str]]:
+    def searchUsers(
+        self, pattern: str, limit: typing.Optional[int] = None
+    ) -> typing.Iterable[typing.Dict[str, str]]:
         try:
             res = []
             for r in ldaputil.getAsDict(
@@ -486,7 +488,8 @@ class SimpleLDAPAuthenticator(auths.Authenticator):
                 ldapFilter='(&(objectClass=%s)(%s=%s*))'
                 % (self._userClass, self._userIdAttr, pattern),
                 attrList=[self._userIdAttr, self._userNameAttr],
-                sizeLimit=LDAP_RESULT_LIMIT,
+                sizeLimit=min(limit or LDAP_RESULT_LIMIT, LDAP_RESULT_LIMIT),
+                partialResults=True,
             ):
                 res.append(
                     {
@@ -502,7 +505,9 @@ class SimpleLDAPAuthenticator(auths.Authenticator):
                 _('Too many results, be more specific')
             )
 
-    def searchGroups(self, pattern: str) -> typing.Iterable[typing.Dict[str, str]]:
+    def searchGroups(
+        self, pattern: str, limit: typing.Optional[int] = None
+    ) -> typing.Iterable[typing.Dict[str, str]]:
         try:
             res = []
             for r in ldaputil.getAsDict(
@@ -511,7 +516,8 @@ class SimpleLDAPAuthenticator(auths.Authenticator):
                 ldapFilter='(&(objectClass=%s)(%s=%s*))'
                 % (self._groupClass, self._groupIdAttr, pattern),
                 attrList=[self._groupIdAttr, 'memberOf', 'description'],
-                sizeLimit=LDAP_RESULT_LIMIT,
+                sizeLimit=min(limit or LDAP_RESULT_LIMIT, LDAP_RESULT_LIMIT),
+                partialResults=True,
             ):
                 res.append({'id': r[self._groupIdAttr][0], 'name': r['description'][0]})
 
@@ -292,7 +292,9 @@ class Authenticator(Module):
         """
         return cls.authenticate is not Authenticator.authenticate
 
-    def searchUsers(self, pattern: str) -> typing.Iterable[typing.Dict[str, str]]:
+    def searchUsers(
+        self, pattern: str, limit: typing.Optional[int] = None
+    ) -> typing.Iterable[typing.Dict[str, str]]:
         """
         If you provide this method, the user will be allowed to search users,
         that is, the search button at administration interface, at user form,
@@ -306,13 +308,16 @@ class Authenticator(Module):
 
         Args:
             pattern: Pattern to search for (simple pattern, string)
+            limit: If not None, max number of results needed, so backend search can be limited
 
         Returns
             a list of found users for the pattern specified
         """
         return []
 
-    def searchGroups(self, pattern: str) -> typing.Iterable[typing.Dict[str, str]]:
+    def searchGroups(
+        self, pattern: str, limit: typing.Optional[int] = None
+    ) -> typing.Iterable[typing.Dict[str, str]]:
         """
         Returns an array of groups that match the supplied pattern
         If none found, returns empty array. Items returned are BaseGroups (or derived)
@@ -322,6 +327,8 @@ class Authenticator(Module):
         Must return array of dictionaries that must contains 'id' and 'name'
         example: [ {'id': 'user1', 'name': 'Nombre 1'} ]
 
+        If limit is not None, it is the max number of results needed, so backend search can be limited
+
         Default implementation returns empty array, but is never used because if
         not overriden, search of groups will not be allowed.
         """
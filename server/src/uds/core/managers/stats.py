@@ -266,6 +266,55 @@ class StatsManager(metaclass=singleton.Singleton):
         """
         return StatsEvents.get_stats(ownerType, eventType, **kwargs)
 
+    def iterEvents(
+        self,
+        ownerType: typing.Union[int, typing.Iterable[int]],
+        eventType: typing.Union[int, typing.Iterable[int]],
+        fields: typing.Iterable[str],
+        **kwargs
+    ) -> typing.Iterator[typing.Tuple]:
+        """
+        Iterates over events, not keeping them in memory
+
+        Args:
+
+            ownerType: Type of counter to get values
+            eventType:
+            fields: Fields to retrieve, in order, for every event
+            from: date from what to obtain counters. Unlimited if not specified
+            to: date until obtain counters. Unlimited if not specified
+            order_by: field (or fields) to sort events by
+
+        Returns:
+
+            Iterator, containing a tuple with requested fields for each element
+        """
+        return StatsEvents.iter_stats(ownerType, eventType, fields, **kwargs)
+
+    def getGroupedEvents(
+        self,
+        ownerType: typing.Union[int, typing.Iterable[int]],
+        eventType: typing.Union[int, typing.Iterable[int]],
+        **kwargs
+    ) -> 'models.QuerySet':
+        """
+        Counts events grouped by intervals, on database
+
+        Args:
+
+            ownerType: Type of counter to get values
+            eventType:
+            from: date from what to obtain counters. Unlimited if not specified
+            to: date until obtain counters. Unlimited if not specified
+            interval: length of intervals, in seconds
+            offset: stamp intervals are aligned to
+
+        Returns:
+
+            Iterable, containing a dict with 'owner_type', 'group_stamp' and 'count' for each interval with events
+        """
+        return StatsEvents.get_grouped(ownerType, eventType, **kwargs)
+
     def tailEvents(
         self,
         *,
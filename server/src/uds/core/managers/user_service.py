@@ -800,15 +800,14 @@ class UserServiceManager(metaclass=singleton.Singleton):
                     idTransport = t.uuid
                     break
 
+        # Ensures that the transport exists and is allowed for this service, on a single query
         try:
-            transport: Transport = Transport.objects.get(uuid=idTransport)
+            transport: Transport = userService.deployed_service.transports.get(
+                uuid=idTransport
+            )
         except Exception:
             raise InvalidServiceException()
 
-        # Ensures that the transport is allowed for this service
-        if userService.deployed_service.transports.filter(id=transport.id).count() == 0:
-            raise InvalidServiceException()
-
         # If transport is not available for the request IP...
         if not transport.validForIp(srcIp):
             msg = _('The requested transport {} is not valid for {}').format(
@@ -34,6 +34,7 @@ UDS Service modules interfaces and classes.
 """
 from .transport import Transport
 from .transport import DIRECT_GROUP, TUNNELED_GROUP
+from .transport import loadScript
 from .transport_factory import TransportsFactory
 from . import protocols
 
@@ -31,7 +31,10 @@
 @author: Adolfo Gómez, dkmaster at dkmon dot com
 """
 import codecs
+import functools
 import logging
+import os
+import pathlib
 import typing
 
 from django.utils.translation import gettext_noop as _
@@ -53,6 +56,19 @@ DIRECT_GROUP = _('Direct')
 TUNNELED_GROUP = _('Tunneled')
 
 
+@functools.lru_cache(maxsize=32)
+def loadScript(scriptDir: str, scriptName: str) -> typing.Tuple[str, str]:
+    """
+    Returns the transport script scriptName, located at scriptDir, and its signature.
+    Scripts do not change at runtime, so they are read only once.
+    """
+    path = os.path.join(scriptDir, scriptName)
+    return (
+        pathlib.Path(path).read_text(encoding='utf-8'),
+        pathlib.Path(path + '.signature').read_text(encoding='utf-8'),
+    )
+
+
 class Transport(Module):
     """
     An OS Manager is responsible for communication the service the different actions to take (i.e. adding a windows machine to a domain)
@@ -125,10 +125,13 @@ def getAsDict(
     attrList: typing.Optional[typing.Iterable[str]]=None,
     sizeLimit: int=100,
     scope=SCOPE_SUBTREE,
+    partialResults: bool=False,
 ) -> typing.Generator[LDAPResultType, None, None]:
     """
     Makes a search on LDAP, adjusting string to required type (ascii on python2, str on python3).
     returns an generator with the results, where each result is a dictionary where it values are always a list of strings
+
+    If partialResults is True, reaching sizeLimit is not an error, and entries received up to it are returned.
     """
     logger.debug('Filter: %s, attr list: %s', ldapFilter, attrList)
 
@@ -138,13 +141,32 @@ def getAsDict(
     res = None
     try:
         # On python2, attrs and search string is str (not unicode), in 3, str (not bytes)
-        res = con.search_ext_s(
-            base,
-            scope=scope,
-            filterstr=ldapFilter,
-            attrlist=attrList,
-            sizelimit=sizeLimit,
-        )
+        if not partialResults:
+            res = con.search_ext_s(
+                base,
+                scope=scope,
+                filterstr=ldapFilter,
+                attrlist=attrList,
+                sizelimit=sizeLimit,
+            )
+        else:
+            # Entries are read one by one, so the ones received before size limit is reached are kept
+            res = []
+            msgid = con.search_ext(
+                base,
+                scope=scope,
+                filterstr=ldapFilter,
+                attrlist=attrList,
+                sizelimit=sizeLimit,
+            )
+            try:
+                while True:
+                    rtype, rdata, _rmsgid, _rctrls = con.result3(msgid, all=0)
+                    if rtype == ldap.RES_SEARCH_RESULT:  # type: ignore
+                        break
+                    res.extend(rdata)
+            except ldap.SIZELIMIT_EXCEEDED:  # type: ignore
+                pass
     except ldap.LDAPError as e:  # type: ignore
         LDAPError.reraise(e)
     except Exception as e:
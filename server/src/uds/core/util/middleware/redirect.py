@@ -58,6 +58,10 @@ class RedirectMiddleware:
         # And also the tunnel
         'uds/rest/tunnel',
     ]
+    # Precomputed prefixes of NO_REDIRECT, so it can be checked with a single startswith
+    _NO_REDIRECT_PREFIXES: typing.ClassVar[typing.Tuple[str, ...]] = tuple(
+        '/' + nr for nr in NO_REDIRECT
+    )
 
     get_response: typing.Any  # typing.Callable[['HttpRequest'], 'HttpResponse']
 
@@ -68,11 +72,7 @@ class RedirectMiddleware:
 
     def __call__(self, request: 'HttpRequest') -> 'HttpResponse':
         full_path = request.get_full_path()
-        redirect = True
-        for nr in RedirectMiddleware.NO_REDIRECT:
-            if full_path.startswith('/' + nr):
-                redirect = False
-                break
+        redirect = not full_path.startswith(RedirectMiddleware._NO_REDIRECT_PREFIXES)
 
         if (
             redirect
@@ -81,10 +81,12 @@ class RedirectMiddleware:
         ):
             if request.method == 'POST':
                 # url = request.build_absolute_uri(GlobalConfig.LOGIN_URL.get())
-                url = reverse('page.login')
+                url = 'https://' + request.get_host() + reverse('page.login')
             else:
+                # Only scheme is replaced, "http://" on query string is kept
                 url = request.build_absolute_uri(full_path)
-            url = url.replace('http://', 'https://')
+                if url.startswith('http://'):
+                    url = 'https://' + url[7:]
 
             return HttpResponseRedirect(url)
         return self.get_response(request)
@@ -92,3 +94,4 @@ class RedirectMiddleware:
     @staticmethod
     def registerException(path: str) -> None:
         RedirectMiddleware.NO_REDIRECT.append(path)
+        RedirectMiddleware._NO_REDIRECT_PREFIXES += ('/' + path,)
@@ -88,6 +88,33 @@ def getEffectivePermission(
         return PERMISSION_NONE
 
 
+def getEffectivePermissions(
+    user: 'models.User', objs: typing.Iterable['Model']
+) -> typing.Dict[typing.Any, int]:
+    """
+    Returns the effective permissions (keyed by pk) of an user over a list of objects of same type,
+    using just one query for all of them instead of one for each object.
+    """
+    objs = list(objs)
+    if not objs:
+        return {}
+    try:
+        if user.is_admin:
+            return {obj.pk: PERMISSION_ALL for obj in objs}
+
+        if not user.staff_member:
+            return {obj.pk: PERMISSION_NONE for obj in objs}
+
+        return models.Permissions.getPermissionsForObjects(
+            user=user,
+            groups=user.groups.all(),
+            object_type=ot.getObjectType(objs[0]),
+            object_ids=[obj.pk for obj in objs],
+        )
+    except Exception:
+        return {obj.pk: PERMISSION_NONE for obj in objs}
+
+
 def addUserPermission(
     user: 'models.User', obj: 'Model', permission: int = PERMISSION_READ
 ):
@@ -240,16 +240,22 @@ def getEvents(
     else:
         owner_id = obj.pk
 
-    for i in StatsManager.manager().getEvents(
-        __transDict[type_], eventType, owner_id=owner_id, since=since, to=to
+    # Only needed fields are read, without building model instances
+    for stamp, fld1, fld2, fld3, fld4, event_type in StatsManager.manager().iterEvents(
+        __transDict[type_],
+        eventType,
+        ('stamp', 'fld1', 'fld2', 'fld3', 'fld4', 'event_type'),
+        owner_id=owner_id,
+        since=since,
+        to=to,
     ):
         yield EventTupleType(
-            datetime.datetime.fromtimestamp(i.stamp),
-            i.fld1,
-            i.fld2,
-            i.fld3,
-            i.fld4,
-            i.event_type,
+            datetime.datetime.fromtimestamp(stamp),
+            fld1,
+            fld2,
+            fld3,
+            fld4,
+            event_type,
         )
  
  # tail the events table
@@ -1,3 +1,4 @@
+import io
 import stat
 import calendar
 import datetime
@@ -232,14 +233,16 @@ class StatsFS(types.UDSFSInterface):
             size,
         )
         # Get stats events from last 24 hours (in UTC) stamp is unix timestamp
-        virtualFile = models.StatsEvents.getCSVHeader().encode() + b'\n'
+        virtualFile = io.StringIO()
         # stamp is unix timestamp
-        for record in models.StatsEvents.objects.filter(
-            stamp__gte=interval.start_timestamp, stamp__lte=interval.end_timestamp
-        ):
-            virtualFile += record.toCsv().encode() + b'\n'
+        models.StatsEvents.exportCsv(
+            virtualFile,
+            models.StatsEvents.objects.filter(
+                stamp__gte=interval.start_timestamp, stamp__lte=interval.end_timestamp
+            ),
+        )
 
-        return virtualFile
+        return virtualFile.getvalue().encode()
 
     def _read_pools(
         self, interval: StatInterval, extension: str, size: int, offset: int
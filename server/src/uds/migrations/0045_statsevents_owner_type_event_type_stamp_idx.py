@@ -0,0 +1,17 @@
+# Generated by Django 4.0.3 on 2022-04-05 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uds', '0044_notification_remove_authenticator_visible_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='statsevents',
+            index=models.Index(fields=['owner_type', 'event_type', 'stamp'], name='uds_stats_e_owner_t_ba1c37_idx'),
+        ),
+    ]
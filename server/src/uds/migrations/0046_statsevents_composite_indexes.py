@@ -0,0 +1,32 @@
+# Generated by Django 4.0.3 on 2022-04-05 12:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uds', '0045_statsevents_owner_type_event_type_stamp_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='statsevents',
+            name='event_type',
+            field=models.SmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='statsevents',
+            name='owner_id',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='statsevents',
+            name='owner_type',
+            field=models.SmallIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='statsevents',
+            index=models.Index(fields=['owner_id', 'stamp'], name='uds_stats_e_owner_i_0217ed_idx'),
+        ),
+    ]
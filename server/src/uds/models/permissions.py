@@ -31,6 +31,7 @@
 .. moduleauthor:: Adolfo Gómez, dkmaster at dkmon dot com
 """
 import logging
+import typing
 
 from django.utils.translation import gettext as _
 from django.db import models
@@ -181,6 +182,51 @@ class Permissions(UUIDModel):
         except Exception:  # DoesNotExists
             return Permissions.PERMISSION_NONE
 
+    @staticmethod
+    def getPermissionsForObjects(**kwargs) -> typing.Dict[int, int]:
+        """
+        Retrieves the permissions for a set of objects of same type, using a single query
+        It's mandatory to include at least object_type and object_ids params
+
+        @param object_type: Required
+        @param object_ids: Required, Iterable of object ids
+        @param user: Optional, User (db object)
+        @param groups: Optional List of db groups
+
+        @return: A dictionary where key is the object id and value the permission
+        """
+        object_type = kwargs.get('object_type', None)
+        if object_type is None:
+            raise Exception('Needs at least the object_type field')
+
+        object_ids = list(kwargs.get('object_ids', []))
+
+        user = kwargs.get('user', None)
+        groups = kwargs.get('groups', [])
+
+        if user is None and not groups:
+            q = Q()
+        else:
+            q = Q(user=user) | Q(group__in=groups)
+
+        # Permissions with no object_id applies to all objects of this type
+        result: typing.Dict[typing.Optional[int], int] = {
+            None: Permissions.PERMISSION_NONE
+        }
+        for object_id, permission in Permissions.objects.filter(
+            Q(object_type=object_type),
+            Q(object_id=None) | Q(object_id__in=object_ids),
+            q,
+        ).values_list('object_id', 'permission'):
+            result[object_id] = max(
+                result.get(object_id, Permissions.PERMISSION_NONE), permission
+            )
+
+        return {
+            i: max(result[None], result.get(i, Permissions.PERMISSION_NONE))
+            for i in object_ids
+        }
+
     @staticmethod
     def enumeratePermissions(object_type, object_id) -> 'models.QuerySet[Permissions]':
         """
@@ -30,7 +30,9 @@
 """
 .. moduleauthor:: Adolfo Gómez, dkmaster at dkmon dot com
 """
+import csv
 import datetime
+import time
 import logging
 import typing
 import types
@@ -42,15 +44,30 @@ from .util import getSqlDatetimeAsUnix
 
 logger = logging.getLogger(__name__)
 
+# Events & types names, uds.core.util.stats.events imports models, so it is resolved on first use
+_names: typing.Optional[
+    typing.Tuple[typing.Mapping[int, str], typing.Mapping[int, str]]
+] = None
+
+
+def _getNames() -> typing.Tuple[typing.Mapping[int, str], typing.Mapping[int, str]]:
+    global _names
+    if _names is None:
+        from uds.core.util.stats.events import EVENT_NAMES, TYPES_NAMES
+
+        _names = (EVENT_NAMES, TYPES_NAMES)
+    return _names
+
 
 class StatsEvents(models.Model):
     """
     Statistics about events (login, logout, whatever...)
     """
 
-    owner_id = models.IntegerField(db_index=True, default=0)
-    owner_type = models.SmallIntegerField(db_index=True, default=0)
-    event_type = models.SmallIntegerField(db_index=True, default=0)
+    # owner_id, owner_type and event_type are covered by composite indexes (see Meta)
+    owner_id = models.IntegerField(default=0)
+    owner_type = models.SmallIntegerField(default=0)
+    event_type = models.SmallIntegerField(default=0)
     stamp = models.IntegerField(db_index=True, default=0)
 
     # Variable fields, depends on event
@@ -69,6 +86,10 @@ class StatsEvents(models.Model):
 
         db_table = 'uds_stats_e'
         app_label = 'uds'
+        indexes = [
+            models.Index(fields=['owner_type', 'event_type', 'stamp']),
+            models.Index(fields=['owner_id', 'stamp']),
+        ]
 
     @staticmethod
     def get_stats(
@@ -109,6 +130,58 @@ class StatsEvents(models.Model):
         # We use result as an iterator
         return fltr
 
+    @staticmethod
+    def iter_stats(
+        owner_type: typing.Union[int, typing.Iterable[int]],
+        event_type: typing.Union[int, typing.Iterable[int]],
+        fields: typing.Iterable[str],
+        **kwargs,
+    ) -> typing.Iterator[typing.Tuple]:
+        """
+        Same filters as get_stats, but returns an iterator of tuples with requested fields values, read from db in chunks
+        (server side cursor where supported), so neither model instances nor full result are kept in memory.
+
+        kwargs may also contain 'order_by' (field name or iterable of field names)
+        """
+        fltr = StatsEvents.get_stats(owner_type, event_type, **kwargs)
+
+        order_by = kwargs.get('order_by')
+        if order_by:
+            fltr = fltr.order_by(
+                *((order_by,) if isinstance(order_by, str) else order_by)
+            )
+
+        return fltr.values_list(*fields).iterator(chunk_size=5000)
+
+    @staticmethod
+    def get_grouped(
+        owner_type: typing.Union[int, typing.Iterable[int]],
+        event_type: typing.Union[int, typing.Iterable[int]],
+        **kwargs,
+    ) -> 'models.QuerySet':
+        """
+        Returns the number of events grouped by owner_type and interval (in seconds, default 600)
+        for owner_type and owner_id (optional). Grouping is done by the database.
+
+        Intervals are aligned to 'offset' (default 0), so intervals starting at any stamp can be used.
+
+        Every returned element is a dict containing 'owner_type', 'group_stamp' (start of interval) and 'count'
+        """
+        interval = int(
+            kwargs.pop('interval', None) or 600
+        )  # By default, group items in ten minutes interval (600 seconds)
+        offset = int(kwargs.pop('offset', None) or 0)
+
+        return (
+            StatsEvents.get_stats(owner_type, event_type, **kwargs)
+            .annotate(
+                group_stamp=models.F('stamp') - (models.F('stamp') - offset) % interval
+            )
+            .values('owner_type', 'group_stamp')
+            .annotate(count=models.Count('id'))
+            .order_by('group_stamp')
+        )
+
     # Utility aliases for reading
     @property
     def username(self) -> str:
@@ -154,7 +227,7 @@ class StatsEvents(models.Model):
 
     # Return record as csv line using separator (default: ',')
     def toCsv(self, sep: str = ',') -> str:
-        from uds.core.util.stats.events import EVENT_NAMES, TYPES_NAMES
+        EVENT_NAMES, TYPES_NAMES = _getNames()
 
         return sep.join(
             [
@@ -169,6 +242,58 @@ class StatsEvents(models.Model):
             ]
         )
 
+    @staticmethod
+    def exportCsv(
+        stream: typing.TextIO,
+        query: typing.Optional['models.QuerySet[StatsEvents]'] = None,
+        sep: str = ',',
+    ) -> None:
+        """
+        Writes header and records of query (all events if not provided) as csv to stream.
+
+        Records are read as plain tuples in chunks, so no model instance is created for each one.
+        """
+        EVENT_NAMES, TYPES_NAMES = _getNames()
+
+        if query is None:
+            query = StatsEvents.objects.all()
+
+        writer = csv.writer(stream, delimiter=sep, lineterminator='\n')
+        writer.writerow(StatsEvents.getCSVHeader(sep).split(sep))
+        writer.writerows(
+            (
+                TYPES_NAMES.get(owner_type, '?'),
+                owner_id,
+                EVENT_NAMES.get(event_type, '?'),
+                time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(stamp)),
+                fld1,
+                fld2,
+                fld3,
+                fld4,
+            )
+            for (
+                owner_type,
+                owner_id,
+                event_type,
+                stamp,
+                fld1,
+                fld2,
+                fld3,
+                fld4,
+            ) in query.values_list(
+                'owner_type',
+                'owner_id',
+                'event_type',
+                'stamp',
+                'fld1',
+                'fld2',
+                'fld3',
+                'fld4',
+            ).iterator(
+                chunk_size=10000
+            )
+        )
+
     def __str__(self):
         return 'Log of {}({}): {} - {} - {}, {}, {}'.format(
             self.owner_type,
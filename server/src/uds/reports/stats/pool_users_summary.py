@@ -88,31 +88,28 @@ class UsageSummaryByUsersPool(StatsReport):
         end = self.endDate.stamp()
         logger.debug(self.pool.value)
 
-        items = (
-            StatsManager.manager()
-            .getEvents(
-                events.OT_DEPLOYED,
-                (events.ET_LOGIN, events.ET_LOGOUT),
-                owner_id=pool.id,
-                since=start,
-                to=end,
-            )
-            .order_by('stamp')
+        items = StatsManager.manager().iterEvents(
+            events.OT_DEPLOYED,
+            (events.ET_LOGIN, events.ET_LOGOUT),
+            ('event_type', 'stamp', 'fld4'),
+            owner_id=pool.id,
+            since=start,
+            to=end,
+            order_by='stamp',
         )
 
         logins: typing.Dict[str, int] = {}
         users: typing.Dict[str, typing.Dict] = {}
-        for i in items:
+        for event_type, event_stamp, username in items:
             # if '\\' in i.fld1:
             #    continue
-            username = i.fld4
-            if i.event_type == events.ET_LOGIN:
-                logins[username] = i.stamp
+            if event_type == events.ET_LOGIN:
+                logins[username] = event_stamp
             else:
                 if username in logins:
                     stamp = logins[username]
                     del logins[username]
-                    total = i.stamp - stamp
+                    total = event_stamp - stamp
                     if username not in users:
                         users[username] = {'sessions': 0, 'time': 0}
                     users[username]['sessions'] += 1
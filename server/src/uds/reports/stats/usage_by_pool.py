@@ -97,34 +97,32 @@ class UsageByPool(StatsReport):
             pools = ServicePool.objects.filter(uuid__in=self.pool.value)
         data = []
         for pool in pools:
-            items = (
-                StatsManager.manager()
-                .getEvents(
-                    events.OT_DEPLOYED,
-                    (events.ET_LOGIN, events.ET_LOGOUT),
-                    owner_id=pool.id,
-                    since=start,
-                    to=end,
-                )
-                .order_by('stamp')
+            items = StatsManager.manager().iterEvents(
+                events.OT_DEPLOYED,
+                (events.ET_LOGIN, events.ET_LOGOUT),
+                ('event_type', 'stamp', 'fld2', 'fld4'),
+                owner_id=pool.id,
+                since=start,
+                to=end,
+                order_by='stamp',
             )
 
             logins = {}
-            for i in items:
-                # if '\\' in i.fld1:
+            for event_type, event_stamp, fld2, fld4 in items:
+                # if '\\' in fld1:
                 #    continue
 
-                if i.event_type == events.ET_LOGIN:
-                    logins[i.fld4] = i.stamp
+                if event_type == events.ET_LOGIN:
+                    logins[fld4] = event_stamp
                 else:
-                    if i.fld4 in logins:
-                        stamp = logins[i.fld4]
-                        del logins[i.fld4]
-                        total = i.stamp - stamp
+                    if fld4 in logins:
+                        stamp = logins[fld4]
+                        del logins[fld4]
+                        total = event_stamp - stamp
                         data.append(
                             {
-                                'name': i.fld4,
-                                'origin': i.fld2.split(':')[0],
+                                'name': fld4,
+                                'origin': fld2.split(':')[0],
                                 'date': datetime.datetime.fromtimestamp(stamp),
                                 'time': total,
                                 'pool': pool.uuid,
@@ -114,28 +114,35 @@ class StatsReportLogin(StatsReport):
             xLabelFormat = 'SHORT_DATETIME_FORMAT'
 
         samplingIntervals: typing.List[typing.Tuple[int, int]] = []
+        step = int((end - start) / (samplingPoints + 1))
         prevVal = None
-        for val in range(start, end, int((end - start) / (samplingPoints + 1))):
+        for val in range(start, end, step):
             if prevVal is None:
                 prevVal = val
                 continue
             samplingIntervals.append((prevVal, val))
             prevVal = val
 
+        # Logins of all intervals are counted at once, grouped by database
+        counts: typing.Dict[int, int] = {}
+        if samplingIntervals:
+            counts = {
+                i['group_stamp']: i['count']
+                for i in StatsManager.manager().getGroupedEvents(
+                    events.OT_AUTHENTICATOR,
+                    events.ET_LOGIN,
+                    since=samplingIntervals[0][0],
+                    to=samplingIntervals[-1][1],
+                    interval=step,
+                    offset=start,
+                )
+            }
+
         data = []
         reportData = []
         for interval in samplingIntervals:
             key = (interval[0] + interval[1]) / 2
-            val = (
-                StatsManager.manager()
-                .getEvents(
-                    events.OT_AUTHENTICATOR,
-                    events.ET_LOGIN,
-                    since=interval[0],
-                    to=interval[1],
-                )
-                .count()
-            )
+            val = counts.get(interval[0], 0)
             data.append((key, val))  # @UndefinedVariable
             reportData.append(
                 {
@@ -155,10 +162,10 @@ class StatsReportLogin(StatsReport):
         dataWeek = [0] * 7
         dataHour = [0] * 24
         dataWeekHour = [[0] * 24 for _ in range(7)]
-        for val in StatsManager.manager().getEvents(
-            events.OT_AUTHENTICATOR, events.ET_LOGIN, since=start, to=end
+        for (stamp,) in StatsManager.manager().iterEvents(
+            events.OT_AUTHENTICATOR, events.ET_LOGIN, ('stamp',), since=start, to=end
         ):
-            s = datetime.datetime.fromtimestamp(val.stamp)
+            s = datetime.datetime.fromtimestamp(stamp)
             dataWeek[s.weekday()] += 1
             dataHour[s.hour] += 1
             dataWeekHour[s.weekday()][s.hour] += 1
@@ -51,14 +51,16 @@ def getResources(parameters: typing.Any) -> typing.List[typing.Dict[str, typing.
     provider = OGProvider(env)
     provider.unserialize(parameters['ov'])
 
-    api = provider.api
+    try:
+        ouLabs, ouImages = provider.api.getLabsAndImages(ou=parameters['ou'])
+    finally:
+        # Provider (and its client) is only used for this call
+        provider.resetApi()
 
     labs = [gui.choiceItem('0', _('All Labs'))] + [
-        gui.choiceItem(l['id'], l['name']) for l in api.getLabs(ou=parameters['ou'])
-    ]
-    images = [
-        gui.choiceItem(z['id'], z['name']) for z in api.getImages(ou=parameters['ou'])
+        gui.choiceItem(l['id'], l['name']) for l in ouLabs
     ]
+    images = [gui.choiceItem(z['id'], z['name']) for z in ouImages]
 
     data = [
         {'name': 'lab', 'values': labs},
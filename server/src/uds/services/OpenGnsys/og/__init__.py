@@ -31,11 +31,24 @@
 .. moduleauthor:: Adolfo Gómez, dkmaster at dkmon dot com
 """
 import re
-import json
 import logging
 import typing
+import concurrent.futures
 
 import requests
+import requests.adapters
+
+# orjson is faster, but is optional. If not available, use standard json
+try:
+    import orjson
+
+    _loads: typing.Callable[[bytes], typing.Any] = orjson.loads
+    _dumps: typing.Callable[[typing.Any], bytes] = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj).encode()
 
 from . import urls
 from . import fake
@@ -49,46 +62,63 @@ if typing.TYPE_CHECKING:
 FAKE = False
 CACHE_VALIDITY = 180
 
-RT = typing.TypeVar('RT')
-
-# Decorator
-def ensureConnected(fnc: typing.Callable[..., RT]) -> typing.Callable[..., RT]:
-    def inner(*args, **kwargs) -> RT:
-        args[0].connect()
-        return fnc(*args, **kwargs)
-
-    return inner
-
+# Shared by all clients for concurrent requests, threads are created as needed
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix='OpenGnsys'
+)
 
 # Result checker
 def ensureResponseIsValid(
     response: requests.Response, errMsg: typing.Optional[str] = None
 ) -> typing.Any:
+    # Content is read (and parsed) only once, no matter if response is an error or not
+    content = response.content
     if not response.ok:
         if not errMsg:
             errMsg = 'Invalid response'
 
         try:
-            err = response.json()[
+            err = _loads(content)[
                 'message'
             ]  # Extract any key, in case of error is expected to have only one top key so this will work
         except Exception:
-            err = response.content
-        errMsg = '{}: {}, ({})'.format(errMsg, err, response.status_code)
-        logger.error('%s: %s', errMsg, response.content)
+            err = content
+        errMsg = f'{errMsg}: {err}, ({response.status_code})'
+        logger.error('%s: %s', errMsg, content)
         raise Exception(errMsg)
 
     try:
-        return json.loads(response.content)
+        return _loads(content)
     except Exception:
         raise Exception(
-            'Error communicating with OpenGnsys: {}'.format(
-                response.content[:128].decode()
-            )
+            f'Error communicating with OpenGnsys: {content[:128].decode()}'
         )
 
 
+def _remotePcItems(
+    items: typing.Iterable[typing.Mapping[str, typing.Any]]
+) -> typing.List[typing.MutableMapping[str, str]]:
+    # Keeps only id & name of items with "inremotepc" set to true
+    return [
+        {'id': i['id'], 'name': i['name']}
+        for i in items
+        if i.get('inremotepc') is True
+    ]
+
+
 class OpenGnsysClient:
+    __slots__ = (
+        'username',
+        'password',
+        'endpoint',
+        'auth',
+        'cache',
+        'verifyCert',
+        'cachedVersion',
+        '_base',
+        '_session',
+    )
+
     username: str
     password: str
     endpoint: str
@@ -96,6 +126,8 @@ class OpenGnsysClient:
     cache: 'Cache'
     verifyCert: bool
     cachedVersion: typing.Optional[str]
+    _base: str
+    _session: requests.Session
 
     def __init__(
         self,
@@ -108,58 +140,50 @@ class OpenGnsysClient:
         self.username = username
         self.password = password
         self.endpoint = endpoint
+        self._base = endpoint + '/'
         self.auth = None
         self.cache = cache
         self.verifyCert = verifyCert
         self.cachedVersion = None
+        # Keep connections alive between requests to OpenGnsys
+        self._session = requests.Session()
+        self._session.mount(
+            'https://',
+            requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10),
+        )
+        # Headers are the same for every request, Authorization is added on connect
+        self._session.headers.update({'content-type': 'application/json'})
 
-    @property
-    def headers(self) -> typing.MutableMapping[str, str]:
-        headers = {'content-type': 'application/json'}
-        if self.auth:
-            headers['Authorization'] = self.auth
-
-        return headers
+    def close(self) -> None:
+        self._session.close()
 
-    def _ogUrl(self, path: str) -> str:
-        return self.endpoint + '/' + path
+    def _request(
+        self,
+        method: str,
+        path: str,
+        data: typing.Any = None,
+        errMsg: typing.Optional[str] = None,
+    ) -> typing.Any:
+        return ensureResponseIsValid(
+            self._session.request(
+                method,
+                self._base + path,
+                data=_dumps(data) if data is not None else None,
+                verify=self.verifyCert,
+            ),
+            errMsg=errMsg,
+        )
 
     def _post(
         self, path: str, data: typing.Any, errMsg: typing.Optional[str] = None
     ) -> typing.Any:
-        if not FAKE:
-            return ensureResponseIsValid(
-                requests.post(
-                    self._ogUrl(path),
-                    data=json.dumps(data),
-                    headers=self.headers,
-                    verify=self.verifyCert,
-                ),
-                errMsg=errMsg,
-            )
-        # FAKE Connection :)
-        return fake.post(path, data, errMsg)
+        return self._request('POST', path, data, errMsg=errMsg)
 
     def _get(self, path: str, errMsg: typing.Optional[str] = None) -> typing.Any:
-        if not FAKE:
-            return ensureResponseIsValid(
-                requests.get(
-                    self._ogUrl(path), headers=self.headers, verify=self.verifyCert
-                ),
-                errMsg=errMsg,
-            )
-        # FAKE Connection :)
-        return fake.get(path, errMsg)
+        return self._request('GET', path, errMsg=errMsg)
 
     def _delete(self, path: str, errMsg: typing.Optional[str] = None) -> typing.Any:
-        if not FAKE:
-            return ensureResponseIsValid(
-                requests.delete(
-                    self._ogUrl(path), headers=self.headers, verify=self.verifyCert
-                ),
-                errMsg=errMsg,
-            )
-        return fake.delete(path, errMsg)
+        return self._request('DELETE', path, errMsg=errMsg)
 
     def connect(self) -> None:
         if self.auth:
@@ -168,6 +192,7 @@ class OpenGnsysClient:
         cacheKey = 'auth{}{}'.format(self.endpoint, self.username)
         self.auth = self.cache.get(cacheKey)
         if self.auth:
+            self._session.headers['Authorization'] = self.auth
             return
 
         auth = self._post(
@@ -177,6 +202,7 @@ class OpenGnsysClient:
         )
 
         self.auth = auth['apikey']
+        self._session.headers['Authorization'] = self.auth
         self.cache.put(cacheKey, self.auth, CACHE_VALIDITY)
 
     @property
@@ -189,39 +215,99 @@ class OpenGnsysClient:
 
         return typing.cast(str, self.cachedVersion)
 
-    @ensureConnected
     def getOus(self) -> typing.Any:
         # Returns an array of elements with:
         # 'id': OpenGnsys Id
         # 'name': OU name
         # OpenGnsys already returns it in this format :)
+        if not self.auth:
+            self.connect()
         return self._get(urls.OUS, errMsg='Getting list of ous')
 
-    @ensureConnected
-    def getLabs(self, ou: str) -> typing.List[typing.MutableMapping[str, str]]:
-        # Returns a list of available labs on an ou
+    def _labsCacheKey(self, ou: typing.Any) -> str:
+        return 'labs{}{}'.format(self.endpoint, ou)
+
+    def _imagesCacheKey(self, ou: typing.Any) -> str:
+        return 'images{}{}'.format(self.endpoint, ou)
+
+    def _fetchLabs(self, ou: str) -> typing.List[typing.MutableMapping[str, str]]:
         # /ous/{ouid}/labs
         # Take into accout that we must exclude the ones with "inremotepc" set to false.
         errMsg = 'Getting list of labs from ou {}'.format(ou)
-        return [
-            {'id': l['id'], 'name': l['name']}
-            for l in self._get(urls.LABS.format(ou=ou), errMsg=errMsg)
-            if l.get('inremotepc', False) is True
-        ]
+        return _remotePcItems(self._get(urls.labs(ou=ou), errMsg=errMsg))
 
-    @ensureConnected
-    def getImages(self, ou: str) -> typing.List[typing.MutableMapping[str, str]]:
-        # Returns a list of available labs on an ou
+    def _fetchImages(self, ou: str) -> typing.List[typing.MutableMapping[str, str]]:
         # /ous/{ouid}/images
         # Take into accout that we must exclude the ones with "inremotepc" set to false.
         errMsg = 'Getting list of images from ou {}'.format(ou)
-        return [
-            {'id': l['id'], 'name': l['name']}
-            for l in self._get(urls.IMAGES.format(ou=ou), errMsg=errMsg)
-            if l.get('inremotepc', False) is True
-        ]
+        return _remotePcItems(self._get(urls.images(ou=ou), errMsg=errMsg))
+
+    def getLabs(self, ou: str) -> typing.List[typing.MutableMapping[str, str]]:
+        # Returns a list of available labs on an ou
+        # Labs changes rarely, so they are kept on cache for a while
+        if not self.auth:
+            self.connect()
+        cacheKey = self._labsCacheKey(ou)
+        labs = self.cache.get(cacheKey)
+        if labs is None:
+            labs = self._fetchLabs(ou)
+            self.cache.put(cacheKey, labs, CACHE_VALIDITY)
+        return labs
+
+    def getImages(self, ou: str) -> typing.List[typing.MutableMapping[str, str]]:
+        # Returns a list of available images on an ou
+        # Images changes rarely, so they are kept on cache for a while
+        if not self.auth:
+            self.connect()
+        cacheKey = self._imagesCacheKey(ou)
+        images = self.cache.get(cacheKey)
+        if images is None:
+            images = self._fetchImages(ou)
+            self.cache.put(cacheKey, images, CACHE_VALIDITY)
+        return images
+
+    def _workerClient(self) -> 'OpenGnsysClient':
+        # A client (with its own session) to be used on other thread, as sessions are not thread safe
+        client = OpenGnsysClient(
+            self.username, self.password, self.endpoint, self.cache, self.verifyCert
+        )
+        if self.auth:
+            client.auth = self.auth
+            client._session.headers['Authorization'] = self.auth
+        return client
+
+    def getLabsAndImages(
+        self, ou: str
+    ) -> typing.Tuple[
+        typing.List[typing.MutableMapping[str, str]],
+        typing.List[typing.MutableMapping[str, str]],
+    ]:
+        # Labs and images of an ou are independent requests, so if both are needed they are done concurrently
+        # Connect first, so both requests do not try to log in at same time
+        # Note: cache is only accessed from this thread, worker only does the OpenGnsys request
+        self.connect()
+        labsKey, imagesKey = self._labsCacheKey(ou), self._imagesCacheKey(ou)
+        labs = self.cache.get(labsKey)
+        images = self.cache.get(imagesKey)
+
+        if labs is None and images is None:
+            # Labs are requested by a worker client, images from this thread
+            worker = self._workerClient()
+            labsFuture = _executor.submit(worker._fetchLabs, ou)
+            labsFuture.add_done_callback(lambda _: worker.close())
+            images = self._fetchImages(ou)
+            labs = labsFuture.result()
+            self.cache.put(labsKey, labs, CACHE_VALIDITY)
+            self.cache.put(imagesKey, images, CACHE_VALIDITY)
+        elif labs is None:
+            labs = self._fetchLabs(ou)
+            self.cache.put(labsKey, labs, CACHE_VALIDITY)
+        elif images is None:
+            images = self._fetchImages(ou)
+            self.cache.put(imagesKey, images, CACHE_VALIDITY)
+
+        return labs, images
 
-    @ensureConnected
     def reserve(
         self, ou: str, image: str, lab: int = 0, maxtime: int = 24
     ) -> typing.MutableMapping[str, typing.Union[str, int]]:
@@ -230,9 +316,11 @@ class OpenGnsysClient:
         # invokes /ous/{ouid}}/images/{imageid}/reserve
         # also remember to store "labid"
         # Labid can be "0" that means "all laboratories"
+        if not self.auth:
+            self.connect()
         errMsg = 'Reserving image {} in ou {}'.format(image, ou)
         data = {'labid': lab, 'maxtime': maxtime}
-        res = self._post(urls.RESERVE.format(ou=ou, image=image), data, errMsg=errMsg)
+        res = self._post(urls.reserve(ou=ou, image=image), data, errMsg=errMsg)
         return {
             'ou': ou,
             'image': image,
@@ -244,19 +332,21 @@ class OpenGnsysClient:
             'mac': ':'.join(re.findall('..', res['mac'])),
         }
 
-    @ensureConnected
     def unreserve(self, machineId: str) -> typing.Any:
         # This method releases the previous reservation
         # Invoked every time we need to release a reservation (i mean, if a reservation is done, this will be called with the obtained id from that reservation)
+        if not self.auth:
+            self.connect()
         ou, lab, client = machineId.split('.')
         errMsg = 'Unreserving client {} in lab {} in ou {}'.format(client, lab, ou)
         return self._delete(
-            urls.UNRESERVE.format(ou=ou, lab=lab, client=client), errMsg=errMsg
+            urls.unreserve(ou=ou, lab=lab, client=client), errMsg=errMsg
         )
 
-    @ensureConnected
     def powerOn(self, machineId, image):
         # This method ask to poweron a machine to openGnsys
+        if not self.auth:
+            self.connect()
         ou, lab, client = machineId.split('.')
         errMsg = 'Powering on client {} in lab {} in ou {}'.format(client, lab, ou)
         try:
@@ -264,41 +354,71 @@ class OpenGnsysClient:
                 'image': image,
             }
             return self._post(
-                urls.START.format(ou=ou, lab=lab, client=client), data, errMsg=errMsg
+                urls.start(ou=ou, lab=lab, client=client), data, errMsg=errMsg
             )
         except Exception:  # For now, if this fails, ignore it to keep backwards compat
             return 'OK'
 
-    @ensureConnected
     def notifyURLs(
         self, machineId: str, loginURL: str, logoutURL: str, releaseURL: str
     ) -> typing.Any:
+        if not self.auth:
+            self.connect()
         ou, lab, client = machineId.split('.')
         errMsg = 'Notifying login/logout urls'
         data = {'urlLogin': loginURL, 'urlLogout': logoutURL, 'urlRelease': releaseURL}
 
         return self._post(
-            urls.EVENTS.format(ou=ou, lab=lab, client=client), data, errMsg=errMsg
+            urls.events(ou=ou, lab=lab, client=client), data, errMsg=errMsg
         )
 
-    @ensureConnected
     def notifyDeadline(
         self, machineId: str, deadLine: typing.Optional[int]
     ) -> typing.Any:
+        if not self.auth:
+            self.connect()
         ou, lab, client = machineId.split('.')
         deadLine = deadLine or 0
         errMsg = 'Notifying deadline'
         data = {'deadLine': deadLine}
 
         return self._post(
-            urls.SESSIONS.format(ou=ou, lab=lab, client=client), data, errMsg=errMsg
+            urls.sessions(ou=ou, lab=lab, client=client), data, errMsg=errMsg
         )
 
-    @ensureConnected
     def status(self, id_: str) -> typing.Any:
         # This method gets the status of the machine
         # /ous/{uoid}/labs/{labid}/clients/{clientid}/status
         # possible status are ("off", "oglive", "busy", "linux", "windows", "macos" o "unknown").
         # Look at api at informatica.us..
+        if not self.auth:
+            self.connect()
         ou, lab, client = id_.split('.')
-        return self._get(urls.STATUS.format(ou=ou, lab=lab, client=client))
+        return self._get(urls.status(ou=ou, lab=lab, client=client))
+
+
+# FAKE Connection :)
+# Bound once here, so real requests do not check FAKE on every call
+if FAKE:
+
+    def _fakePost(
+        self: OpenGnsysClient,
+        path: str,
+        data: typing.Any,
+        errMsg: typing.Optional[str] = None,
+    ) -> typing.Any:
+        return fake.post(path, data, errMsg)
+
+    def _fakeGet(
+        self: OpenGnsysClient, path: str, errMsg: typing.Optional[str] = None
+    ) -> typing.Any:
+        return fake.get(path, errMsg)
+
+    def _fakeDelete(
+        self: OpenGnsysClient, path: str, errMsg: typing.Optional[str] = None
+    ) -> typing.Any:
+        return fake.delete(path, errMsg)
+
+    OpenGnsysClient._post = _fakePost  # type: ignore
+    OpenGnsysClient._get = _fakeGet  # type: ignore
+    OpenGnsysClient._delete = _fakeDelete  # type: ignore
@@ -138,9 +138,7 @@ def post(
     if path == urls.LOGIN:
         return AUTH
 
-    if path == urls.RESERVE.format(ou=1, image=1) or path == urls.RESERVE.format(
-        ou=1, image=2
-    ):
+    if path == urls.reserve(ou=1, image=1) or path == urls.reserve(ou=1, image=2):
         res = copy.deepcopy(RESERVE)
         res['name'] += str(random.randint(5000, 100000))
         res['mac'] = ''.join(random.choice('0123456789ABCDEF') for _ in range(12))
@@ -160,13 +158,13 @@ def get(
         return INFO
     if path == urls.OUS:
         return OUS
-    if path == urls.LABS.format(ou=1):
+    if path == urls.labs(ou=1):
         return LABS
-    if path == urls.LABS.format(ou=2):
+    if path == urls.labs(ou=2):
         return []  # Empty
-    if path == urls.IMAGES.format(ou=1):
+    if path == urls.images(ou=1):
         return IMAGES
-    if path == urls.IMAGES.format(ou=2):
+    if path == urls.images(ou=2):
         return []
     if path[-6:] == 'status':
         rnd = random.randint(0, 100)
@@ -32,15 +32,44 @@
 # API URL 1: https://www.informatica.us.es/~ramon/opengnsys/?url=opengnsys-api.yml
 # API URL 2: http://opengnsys.es/wiki/ApiRest
 
+import typing
+
 LOGIN = '/login'
 INFO = '/info'
 OUS = '/ous'
-LABS = '/ous/{ou}/labs'
-IMAGES = '/ous/{ou}/images'
-RESERVE = '/ous/{ou}/images/{image}/reserve'
-UNRESERVE = '/ous/{ou}/labs/{lab}/clients/{client}/unreserve'
-STATUS = '/ous/{ou}/labs/{lab}/clients/{client}/status'
-EVENTS = '/ous/{ou}/labs/{lab}/clients/{client}/events'
-SESSIONS = '/ous/{ou}/labs/{lab}/clients/{client}/session'
+
+# Urls with parameters are built by functions, so no template is parsed on every request
+Id = typing.Union[str, int]
+
+
+def labs(ou: Id) -> str:
+    return f'/ous/{ou}/labs'
+
+
+def images(ou: Id) -> str:
+    return f'/ous/{ou}/images'
+
+
+def reserve(ou: Id, image: Id) -> str:
+    return f'/ous/{ou}/images/{image}/reserve'
+
+
+def unreserve(ou: Id, lab: Id, client: Id) -> str:
+    return f'/ous/{ou}/labs/{lab}/clients/{client}/unreserve'
+
+
+def status(ou: Id, lab: Id, client: Id) -> str:
+    return f'/ous/{ou}/labs/{lab}/clients/{client}/status'
+
+
+def events(ou: Id, lab: Id, client: Id) -> str:
+    return f'/ous/{ou}/labs/{lab}/clients/{client}/events'
+
+
+def sessions(ou: Id, lab: Id, client: Id) -> str:
+    return f'/ous/{ou}/labs/{lab}/clients/{client}/session'
+
+
 # TODO: fix this
-START = '/ous/{ou}/labs/{lab}/clients/{client}/init'
+def start(ou: Id, lab: Id, client: Id) -> str:
+    return f'/ous/{ou}/labs/{lab}/clients/{client}/init'
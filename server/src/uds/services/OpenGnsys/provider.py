@@ -217,6 +217,8 @@ class OGProvider(ServiceProvider):
         return self._api
 
     def resetApi(self) -> None:
+        if self._api:
+            self._api.close()
         self._api = None
 
     def testConnection(self) -> typing.List[typing.Any]:
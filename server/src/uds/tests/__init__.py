@@ -1,2 +1,3 @@
 from .REST import *
+from .auths import *
 from .messaging import *
@@ -0,0 +1 @@
+from .ldap_search import *
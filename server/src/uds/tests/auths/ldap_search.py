@@ -0,0 +1,113 @@
+import typing
+from unittest import mock
+
+import ldap
+
+from django.test import TestCase
+
+from uds.auths.SimpleLDAP.authenticator import SimpleLDAPAuthenticator, LDAP_RESULT_LIMIT
+from uds.auths.RegexLdap.authenticator import RegexLdap
+
+
+class FakeLDAPConnection:
+    """
+    Mimics a LDAP server with a number of matching entries, honoring sizelimit as servers do
+    """
+
+    def __init__(self, matches: int):
+        self.matches = matches
+        self.sizelimits: typing.List[int] = []
+        self._pending: typing.List[typing.Any] = []
+
+    def _entries(self, count: int) -> typing.List[typing.Any]:
+        return [
+            (
+                'cn=entry{},dc=uds'.format(i),
+                {
+                    'uid': [b'entry%d' % i],
+                    'cn': [b'Entry %d' % i],
+                    'description': [b'Group %d' % i],
+                },
+            )
+            for i in range(count)
+        ]
+
+    def search_ext_s(self, base, scope, filterstr, attrlist, sizelimit):
+        self.sizelimits.append(sizelimit)
+        if sizelimit and self.matches > sizelimit:
+            raise ldap.SIZELIMIT_EXCEEDED({'desc': 'Size limit exceeded'})  # type: ignore
+        return self._entries(self.matches)
+
+    def search_ext(self, base, scope, filterstr, attrlist, sizelimit):
+        self.sizelimits.append(sizelimit)
+        count = min(self.matches, sizelimit) if sizelimit else self.matches
+        self._pending = [[e] for e in self._entries(count)]
+        # Final result, that is an error if more entries matched than allowed
+        self._pending.append(
+            ldap.SIZELIMIT_EXCEEDED({'desc': 'Size limit exceeded'})  # type: ignore
+            if count < self.matches
+            else None
+        )
+        return 1
+
+    def result3(self, msgid, all=1):
+        item = self._pending.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        if item is None:
+            return ldap.RES_SEARCH_RESULT, [], msgid, []  # type: ignore
+        return ldap.RES_SEARCH_ENTRY, item, msgid, []  # type: ignore
+
+
+class LDAPSearchLimitCase(TestCase):
+    """
+    Test that search limit is sent to server, and partial results are returned when reached
+    """
+
+    def _simpleLDAP(self) -> SimpleLDAPAuthenticator:
+        auth = SimpleLDAPAuthenticator.__new__(SimpleLDAPAuthenticator)
+        auth._ldapBase = 'dc=uds'
+        auth._userClass = 'posixAccount'
+        auth._userIdAttr = 'uid'
+        auth._userNameAttr = 'cn'
+        auth._groupClass = 'posixGroup'
+        auth._groupIdAttr = 'cn'
+        return auth
+
+    def _regexLdap(self) -> RegexLdap:
+        auth = RegexLdap.__new__(RegexLdap)
+        auth._ldapBase = 'dc=uds'
+        auth._userClass = 'posixAccount'
+        auth._userIdAttr = 'uid'
+        auth._userNameAttr = 'cn'
+        return auth
+
+    def test_simple_ldap_limit(self):
+        limit = 10
+        con = FakeLDAPConnection(matches=limit + 5)
+        auth = self._simpleLDAP()
+        with mock.patch.object(
+            SimpleLDAPAuthenticator,
+            '_SimpleLDAPAuthenticator__connection',
+            return_value=con,
+        ):
+            users = list(auth.searchUsers('entry', limit=limit))
+            groups = list(auth.searchGroups('Entry', limit=limit))
+
+        self.assertEqual(len(users), limit)
+        self.assertEqual(users[0], {'id': 'entry0', 'name': 'Entry 0'})
+        self.assertEqual(len(groups), limit)
+        self.assertEqual(con.sizelimits, [limit, limit])
+
+    def test_regex_ldap_limit(self):
+        limit = 10
+        con = FakeLDAPConnection(matches=LDAP_RESULT_LIMIT)
+        auth = self._regexLdap()
+        with mock.patch.object(
+            RegexLdap, '_RegexLdap__connection', return_value=con
+        ):
+            users = list(auth.searchUsers('entry', limit=limit))
+
+        self.assertEqual(len(users), limit)
+        self.assertEqual(users[-1], {'id': 'entry9', 'name': 'Entry 9'})
+        self.assertEqual(con.sizelimits, [limit])
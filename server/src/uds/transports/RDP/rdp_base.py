@@ -53,6 +53,8 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 READY_CACHE_TIMEOUT = 30
 
 
@@ -440,13 +442,7 @@ class BaseRDPTransport(transports.Transport):
         osName: str,
         params: typing.Mapping[str, typing.Any],
     ) -> typing.Tuple[str, str, typing.Mapping[str, typing.Any]]:
-        # Reads script
-        scriptNameTemplate = scriptNameTemplate.format(osName)
-        with open(os.path.join(os.path.dirname(__file__), scriptNameTemplate)) as f:
-            script = f.read()
-        # Reads signature
-        with open(
-            os.path.join(os.path.dirname(__file__), scriptNameTemplate + '.signature')
-        ) as f:
-            signature = f.read()
+        script, signature = transports.loadScript(
+            _SCRIPT_DIR, scriptNameTemplate.format(osName)
+        )
         return script, signature, params
@@ -46,6 +46,8 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 READY_CACHE_TIMEOUT = 30
 
 
@@ -202,13 +204,7 @@ class BaseSpiceTransport(transports.Transport):
     def getScript(
         self, scriptNameTemplate: str, osName: str, params: typing.Dict[str, typing.Any]
     ) -> typing.Tuple[str, str, typing.Dict[str, typing.Any]]:
-        # Reads script
-        scriptNameTemplate = scriptNameTemplate.format(osName)
-        with open(os.path.join(os.path.dirname(__file__), scriptNameTemplate)) as f:
-            script = f.read()
-        # Reads signature
-        with open(
-            os.path.join(os.path.dirname(__file__), scriptNameTemplate + '.signature')
-        ) as f:
-            signature = f.read()
+        script, signature = transports.loadScript(
+            _SCRIPT_DIR, scriptNameTemplate.format(osName)
+        )
         return script, signature, params
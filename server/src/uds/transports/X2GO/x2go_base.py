@@ -51,6 +51,8 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 READY_CACHE_TIMEOUT = 30
 SSH_KEY_LENGTH = 1024
 
@@ -272,7 +274,7 @@ class BaseX2GOTransport(transports.Transport):
         return priv, pub
 
     def getAuthorizeScript(self, user: str, pubKey: str) -> str:
-        with open(os.path.join(os.path.dirname(__file__), 'scripts/authorize.py')) as f:
+        with open(os.path.join(_SCRIPT_DIR, 'scripts/authorize.py')) as f:
             data = f.read()
 
         return data.replace('__USER__', user).replace('__KEY__', pubKey)
@@ -288,13 +290,7 @@ class BaseX2GOTransport(transports.Transport):
     def getScript(
         self, scriptNameTemplate: str, osName: str, params: typing.Dict[str, typing.Any]
     ) -> typing.Tuple[str, str, typing.Dict[str, typing.Any]]:
-        # Reads script
-        scriptNameTemplate = scriptNameTemplate.format(osName)
-        with open(os.path.join(os.path.dirname(__file__), scriptNameTemplate)) as f:
-            script = f.read()
-        # Reads signature
-        with open(
-            os.path.join(os.path.dirname(__file__), scriptNameTemplate + '.signature')
-        ) as f:
-            signature = f.read()
+        script, signature = transports.loadScript(
+            _SCRIPT_DIR, scriptNameTemplate.format(osName)
+        )
         return script, signature, params
@@ -153,6 +153,10 @@ def getServicesData(
     logger.debug('Checking meta pools: %s', availMetaPools)
     services = []
 
+    # Invariant for all pools, computed only once
+    defaultGroup = ServicePoolGroup.default().as_dict
+    notifyRemovalByPub = GlobalConfig.NOTIFY_REMOVAL_BY_PUB.getBool(False)
+
     # Metapool helpers
     def transportIterator(member) -> typing.Iterable[Transport]:
         for t in member.pool.transports.all().order_by('priority'):
@@ -270,7 +274,7 @@ def getServicesData(
             group: typing.MutableMapping[str, typing.Any] = (
                 meta.servicesPoolGroup.as_dict
                 if meta.servicesPoolGroup
-                else ServicePoolGroup.default().as_dict
+                else dict(defaultGroup)
             )
 
             services.append(
@@ -338,14 +342,14 @@ def getServicesData(
         group = (
             sPool.servicesPoolGroup.as_dict
             if sPool.servicesPoolGroup
-            else ServicePoolGroup.default().as_dict
+            else dict(defaultGroup)
         )
 
         # Only add toBeReplaced info in case we allow it. This will generate some "overload" on the services
         toBeReplacedDate = (
             sPool.toBeReplaced(request.user)
             if typing.cast(typing.Any, sPool).pubs_active > 0
-            and GlobalConfig.NOTIFY_REMOVAL_BY_PUB.getBool(False)
+            and notifyRemovalByPub
             else None
         )
         # tbr = False